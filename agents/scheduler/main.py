@@ -2,15 +2,24 @@ import sys
 from core.agent import Agent, AgentConfig
 from core.utils import boot, load_yaml
 from core.prompts import load_text
+from core.profiling import pop_profile_flag, profile
 from tools import build_registry
 
 def main():
     boot()
-    user_input = " ".join(sys.argv[1:]) or "Schedule a meeting tomorrow at 15:00 with John"
+    profiling, argv = pop_profile_flag(sys.argv[1:])
+    user_input = " ".join(argv) or "Schedule a meeting tomorrow at 15:00 with John"
     cfg = load_yaml(__file__.replace("main.py", "config.yaml"))
     system = load_text(__file__.replace("main.py", "prompts/system.txt"))
-    agent = Agent("scheduler", AgentConfig(system_prompt=system, llm_model=cfg["llm_model"]), build_registry())
-    out = agent.run(user_input)
+    config = AgentConfig(
+        system_prompt=system,
+        llm_model=cfg["llm_model"],
+        timeout_s=cfg.get("timeout_s"),
+        hedge=cfg.get("hedge", False),
+    )
+    agent = Agent("scheduler", config, build_registry(hedge=config.hedge))
+    with profile("scheduler", user_input, enabled=profiling):
+        out = agent.run(user_input)
     print(out)
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from .deadline import Deadline, DeadlineExceeded
 from .llm import get_llm
 from .tools import ToolRegistry, keyword_router
 
@@ -7,27 +8,36 @@ from .tools import ToolRegistry, keyword_router
 class AgentConfig:
     system_prompt: str
     llm_model: str = "gpt-4o-mini"
+    timeout_s: Optional[float] = None  # overall per-request deadline
+    hedge: bool = False                # hedge slow LLM calls and tool GETs past observed p95
 
 class Agent:
     def __init__(self, name: str, config: AgentConfig, tools: ToolRegistry):
         self.name = name
         self.config = config
         self.tools = tools
-        self.llm = get_llm()
+        self.llm = get_llm(hedge=config.hedge)
 
     def run(self, user_input: str) -> Dict[str, Any]:
-        
+        deadline = Deadline.after(self.config.timeout_s) if self.config.timeout_s else None
+
         # 1) Try routing to a tool
         route = keyword_router(user_input, self.tools)
         if route:
             tool_name = route["tool"]
             args = route["args"]
-            tool_group, method = tool_name.split(".")
+            tool_group, _ = tool_name.split(".")
             tool = self.tools.get(tool_group)
-            result = tool.invoke(action=method, **args)
+            try:
+                result = tool.invoke(action=tool_name, deadline=deadline, **args)
+            except DeadlineExceeded as e:
+                result = {"error": str(e)}
             return {"agent": self.name, "action": tool_name, "result": result}
 
         # 2) Otherwise, just respond via LLM
         prompt = f"{self.config.system_prompt}\n\nUser: {user_input}\nAssistant:"
-        text = self.llm.generate(prompt, model=self.config.llm_model)
+        try:
+            text = self.llm.generate(prompt, model=self.config.llm_model, deadline=deadline)
+        except DeadlineExceeded as e:
+            return {"agent": self.name, "action": "llm.generate", "result": {"error": str(e)}}
         return {"agent": self.name, "action": "llm.generate", "result": {"text": text}}
\ No newline at end of file
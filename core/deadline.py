@@ -0,0 +1,33 @@
+import time
+from typing import Optional
+
+class DeadlineExceeded(TimeoutError):
+    pass
+
+class Deadline:
+    """Absolute point in (monotonic) time by which a request must finish."""
+
+    def __init__(self, expires_at: float):
+        self.expires_at = expires_at
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        return cls(time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+    def check(self) -> None:
+        if self.expired():
+            raise DeadlineExceeded("deadline exceeded")
+
+def time_left(deadline: Optional[Deadline], default: Optional[float] = None) -> Optional[float]:
+    """Timeout to hand to a downstream call: the smaller of `default` and what's left."""
+    if deadline is None:
+        return default
+    deadline.check()
+    left = deadline.remaining()
+    return left if default is None else min(default, left)
@@ -0,0 +1,109 @@
+"""
+Hedged requests: if a call is still running once it passes the observed p95
+latency, fire a second identical call and take whichever finishes first.
+Only use this for idempotent calls (LLM generation, GETs).
+
+Latency samples and the extra-load cap live on a process-wide Hedger per call
+site (see shared_hedger), and p95 needs `min_samples` calls first, so hedging
+only pays off in long-lived processes. None of this repo's entry points are:
+each handles one request and exits.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Deque, Dict, List, Optional, TypeVar
+
+from .deadline import Deadline, DeadlineExceeded
+
+T = TypeVar("T")
+
+POOL_THREAD_PREFIX = "hedge"
+_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix=POOL_THREAD_PREFIX)
+
+class LatencyTracker:
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def p95(self) -> Optional[float]:
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[int(0.95 * (len(ordered) - 1))]
+
+class Hedger:
+    """
+    Runs a zero-arg callable under an optional deadline.
+      - hedge=False (per call): no hedging, but the deadline is still enforced
+      - max_extra: hedges may add at most this fraction of extra calls
+    """
+    def __init__(self, max_extra: float = 0.05, tracker: Optional[LatencyTracker] = None):
+        self.max_extra = max_extra
+        self.tracker = tracker or LatencyTracker()
+        self._calls = 0
+        self._hedges = 0
+        self._lock = threading.Lock()
+
+    def _timed(self, fn: Callable[[], T]) -> T:
+        start = time.monotonic()
+        result = fn()
+        self.tracker.record(time.monotonic() - start)
+        return result
+
+    def _allow_hedge(self) -> bool:
+        with self._lock:
+            if self._hedges + 1 > self.max_extra * self._calls:
+                return False
+            self._hedges += 1
+            return True
+
+    def call(self, fn: Callable[[], T], deadline: Optional[Deadline] = None, hedge: bool = False) -> T:
+        if deadline is not None:
+            deadline.check()
+        with self._lock:
+            self._calls += 1
+
+        delay = self.tracker.p95() if hedge else None
+        if deadline is None and delay is None:
+            return self._timed(fn)
+
+        def left() -> Optional[float]:
+            return None if deadline is None else deadline.remaining()
+
+        futures: List[Future] = [_POOL.submit(self._timed, fn)]
+        if delay is not None:
+            budget = left()
+            done, _ = wait(futures, timeout=delay if budget is None else min(delay, budget))
+            if not done and self._allow_hedge():
+                futures.append(_POOL.submit(self._timed, fn))
+
+        # first success wins; losers keep running in the pool and are ignored
+        pending = set(futures)
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, timeout=left(), return_when=FIRST_COMPLETED)
+            if not done:
+                raise DeadlineExceeded("deadline exceeded")
+            for f in done:
+                if f.exception() is None:
+                    return f.result()
+                error = f.exception()
+        raise error
+
+_SHARED: Dict[str, Hedger] = {}
+_SHARED_LOCK = threading.Lock()
+
+def shared_hedger(key: str) -> Hedger:
+    """Process-wide Hedger for one call site, so latency history outlives instances."""
+    with _SHARED_LOCK:
+        if key not in _SHARED:
+            _SHARED[key] = Hedger()
+        return _SHARED[key]
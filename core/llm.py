@@ -1,24 +1,39 @@
 import os
 from typing import Dict
+from .deadline import time_left
+from .hedging import shared_hedger
 
 class EchoLLM:
     def generate(self, prompt: str, **kwargs) -> str:
         return f"[echo] {prompt[:200]}"
 
 class OpenAILLM:
-    def __init__(self):
+    def __init__(self, hedge: bool = False):
         import openai  # optional dependency
         self.client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.hedge = hedge
+        self.hedger = shared_hedger("openai.generate")
 
     def generate(self, prompt: str, **kwargs) -> str:
-        resp = self.client.chat.completions.create(
-            model=kwargs.get("model", "gpt-4o-mini"),
-            messages=[{"role": "user", "content": prompt}],
-            temperature=kwargs.get("temperature", 0.2),
-        )
+        deadline = kwargs.get("deadline")
+
+        def attempt():
+            # each attempt (incl. a hedge) gets whatever time is left
+            extra = {}
+            timeout = time_left(deadline)
+            if timeout is not None:
+                extra["timeout"] = timeout
+            return self.client.chat.completions.create(
+                model=kwargs.get("model", "gpt-4o-mini"),
+                messages=[{"role": "user", "content": prompt}],
+                temperature=kwargs.get("temperature", 0.2),
+                **extra,
+            )
+
+        resp = self.hedger.call(attempt, deadline, hedge=self.hedge)
         return resp.choices[0].message.content
 
-def get_llm():
+def get_llm(hedge: bool = False):
     if os.getenv("OPENAI_API_KEY"):
-        return OpenAILLM()
+        return OpenAILLM(hedge=hedge)
     return EchoLLM()
\ No newline at end of file
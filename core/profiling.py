@@ -0,0 +1,108 @@
+"""
+Opt-in profiling for agent entry points (stdlib only).
+
+Enable with `--profile` on the command line or AGENT_PROFILE=1. Each profiled
+request writes, under AGENT_PROFILE_DIR (default: ./profiles):
+  - <agent>-<stamp>.pstats     cProfile stats for the calling thread only; work
+                               on hedge_* pool threads (LLM/GET calls under a
+                               deadline) shows as waiting
+  - <agent>-<stamp>.collapsed  sampled stacks of the calling thread plus busy
+                               hedge_* workers, each prefixed with its thread
+                               name; flamegraph.pl / speedscope ready.
+                               The pool is process-wide, so in a server a
+                               concurrent request's LLM/GET call can show up too
+  - <agent>-<stamp>.json       tags: agent name, request input, wall time
+where <stamp> is time, pid and a per-process counter, so repeated requests in
+one process never overwrite each other.
+"""
+
+import cProfile
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from .hedging import POOL_THREAD_PREFIX
+
+PROFILE_FLAG = "--profile"
+_SEQ = itertools.count(1)  # keeps names unique within a process
+
+def pop_profile_flag(argv: List[str]) -> Tuple[bool, List[str]]:
+    """Strip `--profile` from argv; also honour AGENT_PROFILE=1."""
+    enabled = PROFILE_FLAG in argv or os.getenv("AGENT_PROFILE", "") not in ("", "0")
+    return enabled, [a for a in argv if a != PROFILE_FLAG]
+
+class StackSampler:
+    """
+    Samples `thread_id` plus busy worker threads (name starts with
+    `worker_prefix`) every `interval` seconds. Idle workers are skipped.
+    """
+
+    def __init__(self, thread_id: int, worker_prefix: str = POOL_THREAD_PREFIX, interval: float = 0.005):
+        self.thread_id = thread_id
+        self.worker_prefix = worker_prefix
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name="stack-sampler", daemon=True)
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                thread = names.get(ident, f"thread-{ident}")
+                if ident != self.thread_id and not thread.startswith(self.worker_prefix):
+                    continue
+                # idle pool worker: blocked in _worker on the work queue
+                if ident != self.thread_id and frame.f_code.co_name == "_worker":
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                if stack:
+                    self.stacks[";".join([thread, *reversed(stack)])] += 1
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def collapsed(self, root: str) -> str:
+        return "".join(f"{root};{stack} {n}\n" for stack, n in self.stacks.most_common())
+
+@contextmanager
+def profile(agent: str, user_input: str, enabled: bool = True, out_dir: Optional[str] = None) -> Iterator[None]:
+    if not enabled:
+        yield
+        return
+
+    out = Path(out_dir or os.getenv("AGENT_PROFILE_DIR", "profiles"))
+    out.mkdir(parents=True, exist_ok=True)
+    base = out / f"{agent}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{next(_SEQ)}"
+
+    sampler = StackSampler(threading.get_ident())
+    prof = cProfile.Profile()
+    start = time.perf_counter()
+    sampler.start()
+    prof.enable()
+    try:
+        yield
+    finally:
+        prof.disable()
+        sampler.stop()
+        elapsed = time.perf_counter() - start
+        prof.dump_stats(f"{base}.pstats")
+        Path(f"{base}.collapsed").write_text(sampler.collapsed(agent), encoding="utf-8")
+        meta = {"agent": agent, "input": user_input, "elapsed_s": round(elapsed, 6), "samples": sum(sampler.stacks.values())}
+        Path(f"{base}.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        print(f"[profile] wrote {base}.{{pstats,collapsed,json}}", file=sys.stderr)
@@ -1,12 +1,14 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional, Callable
+from .deadline import Deadline
 
 class Tool(ABC):
     name: str
     description: str
 
     @abstractmethod
-    def invoke(self, **kwargs) -> Dict[str, Any]:
+    def invoke(self, action: str, deadline: Optional[Deadline] = None, **kwargs) -> Dict[str, Any]:
+        """Run `action`; pass `deadline` on only to actions that make remote calls."""
         ...
 
 class ToolRegistry:
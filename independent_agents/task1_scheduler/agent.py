@@ -6,7 +6,7 @@ class SchedulerAgent:
     """
     Minimal agent:
       1) Parse NL request -> intent
-      2) Route to calendar tool (create/list)
+      2) Route to calendar tool (create/list/search)
       3) Return structured result
     """
     def __init__(self):
@@ -23,6 +23,20 @@ class SchedulerAgent:
                 "events": events,
             }
 
+        if intent["action"] == "search":
+            events = self.calendar.search_events(
+                attendees=intent["attendees"],
+                title_query=intent["title_query"],
+            )
+            return {
+                "mode": "search",
+                "query": {
+                    "attendees": intent["attendees"],
+                    "title_query": intent["title_query"],
+                },
+                "events": events,
+            }
+
         if intent["action"] == "create":
             # required fields are built by parser with sensible defaults
             created = self.calendar.create_event(
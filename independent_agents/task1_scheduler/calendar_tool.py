@@ -1,6 +1,7 @@
 import json
+import re
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List, Set
 
 DATA_DIR = Path(__file__).parent / "data"
 DATA_DIR.mkdir(exist_ok=True)
@@ -17,17 +18,40 @@ def _load_all() -> List[Dict[str, Any]]:
 def _save_all(events: List[Dict[str, Any]]) -> None:
     CAL_PATH.write_text(json.dumps(events, indent=2), encoding="utf-8")
 
+def _tokens(text: str | None) -> List[str]:
+    # lowercase alphanumeric tokens; shared by indexing and querying
+    return re.findall(r"[a-z0-9]+", (text or "").lower())
+
 class CalendarTool:
     """
     Mock calendar “API”. Persists to data/calendar.json
     Methods:
       - create_event(title, start_iso, end_iso, attendees, note)
       - list_events(date_iso)
+      - search_events(attendees, title_query)
+
+    Search is served from an in-memory inverted index (attendee name token ->
+    event ids, title token -> event ids), built once on init and updated on
+    every create_event.
     """
     def __init__(self):
         # ensure file exists
         if not CAL_PATH.exists():
             _save_all([])
+        self._events_by_id: Dict[str, Dict[str, Any]] = {}
+        self._by_attendee: Dict[str, Set[str]] = {}
+        self._by_title: Dict[str, Set[str]] = {}
+        for event in _load_all():
+            self._index_event(event)
+
+    def _index_event(self, event: Dict[str, Any]) -> None:
+        event_id = event["id"]
+        self._events_by_id[event_id] = event
+        for name in event.get("attendees") or []:
+            for tok in _tokens(name):
+                self._by_attendee.setdefault(tok, set()).add(event_id)
+        for tok in _tokens(event.get("summary")):
+            self._by_title.setdefault(tok, set()).add(event_id)
 
     def create_event(
         self,
@@ -49,9 +73,33 @@ class CalendarTool:
         }
         events.append(event)
         _save_all(events)
+        self._index_event(event)
         return {"ok": True, "event": event}
 
     def list_events(self, date_iso: str) -> List[Dict[str, Any]]:
         events = _load_all()
         # naive filter by date prefix in ISO
         return [e for e in events if e["start"].startswith(date_iso)]
+
+    def search_events(
+        self,
+        attendees: Iterable[str] | None = None,
+        title_query: str | None = None,
+    ) -> List[Dict[str, Any]]:
+        # every attendee/title token must match (AND); no terms -> no results
+        postings: List[Set[str]] = []
+        for name in attendees or []:
+            postings.extend(self._by_attendee.get(tok, set()) for tok in _tokens(name))
+        postings.extend(self._by_title.get(tok, set()) for tok in _tokens(title_query))
+        if not postings:
+            return []
+
+        # intersect smallest-first so work is bounded by the rarest term
+        postings.sort(key=len)
+        ids = set(postings[0])
+        for posting in postings[1:]:
+            if not ids:
+                break
+            ids &= posting
+        hits = [self._events_by_id[i] for i in ids]
+        return sorted(hits, key=lambda e: e["start"])
@@ -110,6 +110,64 @@ def _parse_title(text: str) -> str:
     # sane fallback
     return "Meeting"
 
+SEARCH_STOPWORDS = {
+    "a", "an", "the", "my", "me", "i", "all", "any", "for", "about", "do", "have",
+    "called", "named", "titled", "meeting", "meetings", "event", "events",
+    # date/time words (same ones _parse_title trims)
+    "on", "at", "today", "tomorrow", "morning", "afternoon", "evening",
+} | set(WEEKDAYS)
+
+CREATE_VERBS = r"\b(schedule|book|set\s*up|create|organize)\b"
+# "find time with Maya", "find a slot tomorrow" ask for a new event
+FIND_TIME = r"\b(find|make)\s+(?:some\s+|a\s+)?(time|slot|window)\b"
+# questions are read-only: never fall back to create
+QUESTION = r"^\s*(what|which|any|do\s+i\s+have|find|search|look\s*up)\b"
+WITH_NAMES = r"\bwith\s+([A-Z][a-zA-Z]+(?:[ ,]+[A-Z][a-zA-Z]+)*)"
+
+def _is_create(text: str) -> bool:
+    return bool(
+        re.search(CREATE_VERBS, text, flags=re.IGNORECASE)
+        or re.search(FIND_TIME, text, flags=re.IGNORECASE)
+    )
+
+def _has_date_word(text: str) -> bool:
+    # ignore "with <Names>" so an attendee like "Alex Friday" isn't read as a date
+    t = re.sub(WITH_NAMES, " ", text).lower()
+    return bool(re.search(r"\b(today|tomorrow)\b", t)) or any(re.search(rf"\b{k}\b", t) for k in WEEKDAYS)
+
+def _parse_search_attendees(text: str) -> List[str]:
+    names = _parse_attendees(text)
+    if names:
+        return names
+    # lowercase fallback ("with maya"), minus trailing date/filler words
+    m = re.search(r"\bwith\s+(.+)$", text, flags=re.IGNORECASE)
+    if not m:
+        return []
+    parts = re.split(r",|\band\b", m.group(1), flags=re.IGNORECASE)
+    names = [" ".join(w for w in re.findall(r"[A-Za-z]+", p) if w.lower() not in SEARCH_STOPWORDS) for p in parts]
+    return [n for n in names if n]
+
+def _is_search(text: str) -> bool:
+    # callers rule out create first
+    if re.search(r"\b(find|search|look\s*up)\b", text, flags=re.IGNORECASE):
+        return True
+    # a question about meetings with someone; show/list with a date stays a date list
+    return bool(
+        re.search(r"\b(what|which|any|show|list)\b.*\b(meetings?|events?)\b", text, flags=re.IGNORECASE)
+        and _parse_search_attendees(text)
+        and not _has_date_word(text)
+    )
+
+def _parse_search_title(text: str) -> str:
+    # words after the search verb and before "with", minus filler and times
+    pre_with = re.split(r"\bwith\b", text, flags=re.IGNORECASE)[0]
+    m = re.search(r"\b(?:find|search(?:\s+for)?|look\s*up)\b(.*)", pre_with, flags=re.IGNORECASE)
+    if not m:
+        return ""
+    rest = re.sub(r"\b\d{1,2}(?::[0-5]\d)?\s*(?:am|pm)\b|\b\d{1,2}:[0-5]\d\b", " ", m.group(1), flags=re.IGNORECASE)
+    words = re.findall(r"[A-Za-z0-9]+", rest)
+    return " ".join(w for w in words if w.lower() not in SEARCH_STOPWORDS)
+
 def _compose_iso(date_obj: datetime, hhmm: Optional[str], duration_min: int):
     if hhmm is None:
         hhmm = "15:00"  # sensible default
@@ -122,8 +180,20 @@ def _compose_iso(date_obj: datetime, hhmm: Optional[str], duration_min: int):
 def parse_request(text: str) -> Dict[str, any]:
     t = text.strip()
 
-    # Is this a list request?
-    if re.search(r"\blist\b|\bshow\b|\bwhat'?s on\b|\bmy calendar\b", t, flags=re.IGNORECASE):
+    creating = _is_create(t)
+
+    # Is this a search by attendee / title?
+    if not creating and _is_search(t):
+        return {
+            "action": "search",
+            "attendees": _parse_search_attendees(t),
+            "title_query": _parse_search_title(t),
+        }
+
+    # Is this a list request? (any other read-only question lists the day)
+    if re.search(r"\blist\b|\bshow\b|\bwhat'?s on\b|\bmy calendar\b", t, flags=re.IGNORECASE) or (
+        not creating and re.search(QUESTION, t, flags=re.IGNORECASE)
+    ):
         date_obj = _parse_date_word(t)
         return {
             "action": "list",
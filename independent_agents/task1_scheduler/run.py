@@ -1,11 +1,22 @@
+import os
 import sys
+from contextlib import nullcontext
+from pathlib import Path
 from agent import SchedulerAgent
 
 def main():
     print("hi")
-    text = " ".join(sys.argv[1:]) or "Schedule a 30-min sync with Maya tomorrow afternoon"
+    argv = sys.argv[1:]
+    profiling = False
+    if "--profile" in argv or "AGENT_PROFILE" in os.environ:
+        # opt-in only: reuses the repo's core/profiling.py, so needs the full checkout
+        sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+        from core.profiling import pop_profile_flag, profile
+        profiling, argv = pop_profile_flag(argv)
+    text = " ".join(argv) or "Schedule a 30-min sync with Maya tomorrow afternoon"
     agent = SchedulerAgent()
-    result = agent.handle(text)
+    with profile("task1_scheduler", text) if profiling else nullcontext():
+        result = agent.handle(text)
     # pretty print
     import json
     print(json.dumps(result, indent=2))
@@ -3,12 +3,18 @@ Quick Scheduler — single-file example agent.
 Usage:
   python -m single_agents.quick_scheduler "Schedule a meeting tomorrow at 15:00 with John"
   python -m single_agents.quick_scheduler "List my calendar for today"
+  python -m single_agents.quick_scheduler --profile "List my calendar for today"
+
+--profile (or AGENT_PROFILE=1) uses the repo's core/profiling.py, so it needs
+the full checkout; without it this file has no dependencies on the repo.
 """
 
 import os
 import sys
 import json
+from contextlib import nullcontext
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Dict, Any, Optional
 
 
@@ -215,9 +221,17 @@ class Agent:
 # ---------- Entry Point ----------
 
 def main():
-    user_input = " ".join(sys.argv[1:]) or "List my calendar for today"
+    argv = sys.argv[1:]
+    profiling = False
+    if "--profile" in argv or "AGENT_PROFILE" in os.environ:
+        # opt-in only: reuses the repo's core/profiling.py, so needs the full checkout
+        sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+        from core.profiling import pop_profile_flag, profile
+        profiling, argv = pop_profile_flag(argv)
+    user_input = " ".join(argv) or "List my calendar for today"
     agent = Agent(AgentConfig())
-    out = agent.run(user_input)
+    with profile(agent.cfg.name, user_input) if profiling else nullcontext():
+        out = agent.run(user_input)
     print(json.dumps(out, indent=2))
 
 if __name__ == "__main__":
@@ -0,0 +1,94 @@
+import threading
+import time
+
+import pytest
+
+from core.deadline import Deadline, DeadlineExceeded
+from core.hedging import Hedger, LatencyTracker
+
+
+def warmed(max_extra: float = 0.05, p95: float = 0.01, samples: int = 20) -> Hedger:
+    tracker = LatencyTracker(min_samples=20)
+    for _ in range(samples):
+        tracker.record(p95)
+    return Hedger(max_extra=max_extra, tracker=tracker)
+
+
+class Sleepy:
+    """Callable that sleeps per attempt (by call order) and counts attempts."""
+
+    def __init__(self, *plan):
+        self.plan = plan
+        self.attempts = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            n = self.attempts
+            self.attempts += 1
+        delay, outcome = self.plan[min(n, len(self.plan) - 1)]
+        time.sleep(delay)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def test_no_hedge_below_min_samples():
+    hedger = warmed(max_extra=1.0, samples=19)
+    fn = Sleepy((0.05, "slow"), (0.0, "fast"))
+    assert hedger.call(fn, hedge=True) == "slow"
+    assert fn.attempts == 1
+
+
+def test_no_hedge_when_disabled_per_call():
+    hedger = warmed(max_extra=1.0)
+    fn = Sleepy((0.05, "slow"), (0.0, "fast"))
+    assert hedger.call(fn, Deadline.after(1), hedge=False) == "slow"
+    assert fn.attempts == 1
+
+
+def test_hedges_capped_at_max_extra():
+    hedger = warmed(max_extra=0.05, p95=0.001)
+    hedger.tracker.record = lambda seconds: None  # pin p95 so every call is hedge-eligible
+    fn = Sleepy((0.01, "ok"))
+    for _ in range(40):
+        hedger.call(fn, hedge=True)
+    # 5% of 40 calls -> at most 2 hedges
+    assert fn.attempts - 40 == 2
+
+
+def test_hedge_wins_when_first_is_slow():
+    hedger = warmed(max_extra=1.0)
+    fn = Sleepy((0.2, "slow"), (0.0, "fast"))
+    assert hedger.call(fn, hedge=True) == "fast"
+    assert fn.attempts == 2
+
+
+def test_loser_exception_ignored_when_other_succeeds():
+    hedger = warmed(max_extra=1.0)
+    fn = Sleepy((0.05, RuntimeError("boom")), (0.1, "ok"))
+    assert hedger.call(fn, hedge=True) == "ok"
+
+
+def test_error_raised_when_all_attempts_fail():
+    hedger = warmed(max_extra=1.0)
+    fn = Sleepy((0.05, RuntimeError("first")), (0.0, RuntimeError("second")))
+    with pytest.raises(RuntimeError):
+        hedger.call(fn, hedge=True)
+    assert fn.attempts == 2
+
+
+def test_deadline_raises_while_attempts_pending():
+    hedger = warmed(max_extra=1.0)
+    fn = Sleepy((0.5, "late"))
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        hedger.call(fn, Deadline.after(0.05), hedge=True)
+    assert time.monotonic() - start < 0.3
+
+
+def test_expired_deadline_raises_before_calling():
+    fn = Sleepy((0.0, "ok"))
+    with pytest.raises(DeadlineExceeded):
+        Hedger().call(fn, Deadline.after(-1))
+    assert fn.attempts == 0
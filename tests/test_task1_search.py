@@ -0,0 +1,70 @@
+import pytest
+
+import calendar_tool
+from calendar_tool import CalendarTool
+from parser import parse_request
+
+
+@pytest.fixture
+def calendar(tmp_path, monkeypatch):
+    monkeypatch.setattr(calendar_tool, "CAL_PATH", tmp_path / "calendar.json")
+    return CalendarTool()
+
+
+def ids(events):
+    return [e["id"] for e in events]
+
+
+def test_create_event_updates_index(calendar):
+    assert calendar.search_events(attendees=["Maya"]) == []
+    created = calendar.create_event("Design Review", "2025-10-20T10:00:00", "2025-10-20T11:00:00", ["Maya Lee"])
+    assert calendar.search_events(attendees=["Maya"]) == [created["event"]]
+    assert calendar.search_events(title_query="review") == [created["event"]]
+
+
+def test_index_rebuilt_from_disk(calendar):
+    calendar.create_event("Design Review", "2025-10-20T10:00:00", "2025-10-20T11:00:00", ["Maya Lee"])
+    assert ids(CalendarTool().search_events(attendees=["maya lee"])) == ["evt_0001"]
+
+
+def test_search_intersects_terms(calendar):
+    calendar.create_event("Design Review", "2025-10-21T10:00:00", "2025-10-21T11:00:00", ["Maya Lee"])
+    calendar.create_event("Design Sync", "2025-10-20T10:00:00", "2025-10-20T10:30:00", ["Maya Lee", "Alex"])
+    calendar.create_event("Design Review", "2025-10-22T10:00:00", "2025-10-22T11:00:00", ["Alex"])
+
+    # results come back ordered by start time
+    assert ids(calendar.search_events(attendees=["Maya"])) == ["evt_0002", "evt_0001"]
+    assert ids(calendar.search_events(attendees=["Maya"], title_query="design review")) == ["evt_0001"]
+    assert ids(calendar.search_events(attendees=["Maya", "Alex"])) == ["evt_0002"]
+    assert calendar.search_events(attendees=["Maya"], title_query="standup") == []
+    assert calendar.search_events() == []
+
+
+@pytest.mark.parametrize("text, action", [
+    ("Schedule a 30-min sync with Maya tomorrow afternoon", "create"),
+    ("Book a 1 hour meeting with Alex Friday at 3pm", "create"),
+    ("Find time with Maya tomorrow", "create"),
+    ("Can you find time to schedule a sync with John tomorrow at 3pm", "create"),
+    ("List my calendar for today", "list"),
+    ("Show my meetings with Alex today", "list"),
+    ("What meetings do I have tomorrow", "list"),
+    ("What meetings do I have with Maya", "search"),
+    ("Find the design review", "search"),
+])
+def test_routing(text, action):
+    assert parse_request(text)["action"] == action
+
+
+def test_attendee_named_like_a_weekday_is_searched():
+    intent = parse_request("Any meetings with Alex Friday")
+    assert intent == {"action": "search", "attendees": ["Alex Friday"], "title_query": ""}
+
+
+def test_lowercase_attendee_question_is_searched():
+    intent = parse_request("what meetings do I have with maya")
+    assert intent["action"] == "search"
+    assert intent["attendees"] == ["maya"]
+
+
+def test_search_title_drops_date_words():
+    assert parse_request("Find the design review tomorrow at 3pm")["title_query"] == "design review"
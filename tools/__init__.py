@@ -1,7 +1,7 @@
 from core.tools import ToolRegistry
 from .google_calendar import register as register_google_calendar
 
-def build_registry() -> ToolRegistry:
+def build_registry(hedge: bool = False) -> ToolRegistry:
     reg = ToolRegistry()
-    register_google_calendar(reg)
+    register_google_calendar(reg, hedge=hedge)
     return reg
\ No newline at end of file
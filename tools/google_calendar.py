@@ -3,8 +3,9 @@
 - list_events(date="today") -> returns example events (mocked GET)
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
+from core.deadline import Deadline
 from core.tools import Tool
 from .http_client import post, get
 
@@ -12,28 +13,29 @@ class GoogleCalendarTool(Tool):
     name = "google_calendar"
     description = "Create/list calendar events via a simple API facade."
 
-    def __init__(self, base_url: str | None = None):
+    def __init__(self, base_url: str | None = None, hedge: bool = False):
         # For demo we use httpbin.org to simulate network calls.
         # Swap base_url to the real Google Calendar API gateway.
         self.base_url = base_url or "https://httpbin.org"
+        self.hedge = hedge  # applies to reads only
 
-    def invoke(self, action: str, **kwargs) -> Dict[str, Any]:
+    def invoke(self, action: str, deadline: Optional[Deadline] = None, **kwargs) -> Dict[str, Any]:
         if action == "google_calendar.create_event":
-            return self.create_event(**kwargs)
+            return self.create_event(deadline=deadline, **kwargs)
         if action == "google_calendar.list_events":
-            return self.list_events(**kwargs)
+            return self.list_events(deadline=deadline, **kwargs)
         return {"error": f"Unknown action: {action}"}
 
     # --- Actions ---
-    def create_event(self, title: str, date: str, time: str) -> Dict[str, Any]:
+    def create_event(self, title: str, date: str, time: str, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
         # In real life, translate date/time + timezone -> RFC3339; add attendees, etc.
         payload = {"summary": title, "date": date, "time": time}
         
         # Mocked POST (replace with your gateway that handles OAuth to Google)
-        r = post(f"{self.base_url}/post", json=payload)
+        r = post(f"{self.base_url}/post", json=payload, deadline=deadline)
         return {"ok": r["status_code"] == 200, "request": payload, "response": r["json"]}
 
-    def list_events(self, date: str = "today") -> Dict[str, Any]:
+    def list_events(self, date: str = "today", deadline: Optional[Deadline] = None) -> Dict[str, Any]:
         # Return a simple, deterministic mock list (or call your backend)
         base_date = datetime.utcnow().date()
         if date == "tomorrow":
@@ -43,9 +45,9 @@ class GoogleCalendarTool(Tool):
             {"summary": "1:1",     "start": f"{base_date}T11:30:00Z"},
         ]
         # Mocked GET
-        r = get(f"{self.base_url}/get", params={"date": str(base_date)})
+        r = get(f"{self.base_url}/get", params={"date": str(base_date)}, deadline=deadline, hedge=self.hedge)
         return {"ok": r["status_code"] == 200, "date": str(base_date), "events": sample}
 
 # Registry helper
-def register(registry):
-    registry.register(GoogleCalendarTool())
\ No newline at end of file
+def register(registry, hedge: bool = False):
+    registry.register(GoogleCalendarTool(hedge=hedge))
\ No newline at end of file
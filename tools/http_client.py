@@ -1,12 +1,26 @@
 import requests
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from core.deadline import Deadline, time_left
+from core.hedging import shared_hedger
 
-def post(url: str, json: Dict[str, Any]) -> Dict[str, Any]:
-    resp = requests.post(url, json=json, timeout=10)
+DEFAULT_TIMEOUT_S = 10
+_GET_HEDGER = shared_hedger("http_client.get")
+
+def post(url: str, json: Dict[str, Any], deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+    # POST is not idempotent, so it is never hedged
+    resp = requests.post(url, json=json, timeout=time_left(deadline, DEFAULT_TIMEOUT_S))
     return {"status_code": resp.status_code, "json": safe_json(resp)}
 
-def get(url: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
-    resp = requests.get(url, params=params or {}, timeout=10)
+def get(
+    url: str,
+    params: Dict[str, Any] = None,
+    deadline: Optional[Deadline] = None,
+    hedge: bool = False,
+) -> Dict[str, Any]:
+    def attempt():
+        return requests.get(url, params=params or {}, timeout=time_left(deadline, DEFAULT_TIMEOUT_S))
+
+    resp = _GET_HEDGER.call(attempt, deadline, hedge=hedge)
     return {"status_code": resp.status_code, "json": safe_json(resp)}
 
 def safe_json(resp):